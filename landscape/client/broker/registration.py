@@ -10,6 +10,8 @@ will craft an appropriate one and send it out.
 """
 import json
 import logging
+from functools import partial
+from operator import attrgetter
 
 from twisted.internet.defer import Deferred
 
@@ -46,10 +48,7 @@ def persist_property(name):
 
 
 def config_property(name):
-    def get(self):
-        return getattr(self._config, name)
-
-    return property(get)
+    return property(attrgetter(f"_config.{name}"))
 
 
 class Identity:
@@ -62,6 +61,8 @@ class Identity:
     @ivar account_name: See L{BrokerConfiguration}.
     @ivar registration_password: See L{BrokerConfiguration}.
     @ivar tags: See L{BrokerConfiguration}
+    @ivar validated_tags: C{tags} if they form a valid tag list, C{None}
+        otherwise.
 
     @param config: A L{BrokerConfiguration} object, used to set the
         C{computer_title}, C{account_name} and C{registration_password}
@@ -78,9 +79,22 @@ class Identity:
     access_group = config_property("access_group")
     hostagent_uid = config_property("hostagent_uid")
 
+    __slots__ = ("_config", "_persist", "_validated_tags")
+
     def __init__(self, config, persist):
         self._config = config
         self._persist = persist.root_at("registration")
+        self._validated_tags = None
+
+    @property
+    def validated_tags(self):
+        # The tags only change when the configuration does, so remember the
+        # outcome of the validation for the last value seen.
+        tags = self._config.tags
+        if self._validated_tags is None or self._validated_tags[0] != tags:
+            valid = is_valid_tag_list(tags)
+            self._validated_tags = (tags, tags if valid else None)
+        return self._validated_tags[1]
 
 
 class RegistrationHandler:
@@ -108,6 +122,7 @@ class RegistrationHandler:
         self._pinger = pinger
         self._message_store = message_store
         self._reactor.call_on("run", self._get_juju_data)
+        self._reactor.call_on("run", self._prefetch_machine_info)
         self._reactor.call_on("pre-exchange", self._handle_pre_exchange)
         self._reactor.call_on("exchange-done", self._handle_exchange_done)
         self._exchange.register_message("set-id", self._handle_set_id)
@@ -120,6 +135,8 @@ class RegistrationHandler:
         self._fetch_async = fetch_async
         self._juju_data = None
         self._clone_secure_id = None
+        self._cached_vm_info = None
+        self._cached_container_info = None
 
     def should_register(self):
         id = self._identity
@@ -147,12 +164,58 @@ class RegistrationHandler:
         return result
 
     def _get_juju_data(self):
-        """Load Juju information."""
-        juju_info = get_juju_info(self._config)
+        """Load Juju information in a separate thread.
+
+        Reading the Juju info file is blocking I/O, so keep it off the
+        reactor thread.
+        """
+        self._reactor.call_in_thread(
+            self._set_juju_data,
+            None,
+            get_juju_info,
+            self._config,
+        )
+
+    def _set_juju_data(self, juju_info):
+        """Record the Juju information loaded by L{_get_juju_data}."""
         if juju_info is None:
             return None
         self._juju_data = juju_info
 
+    def _prefetch_machine_info(self):
+        """Look up the VM and container information sent on registration.
+
+        The lookups are done in separate threads at startup, so that the
+        first pre-exchange doesn't have to block on them. If they haven't
+        completed by then, L{_handle_pre_exchange} does them itself.
+
+        The fqdn is not prefetched: it may still change early on boot, and
+        should be the current one whenever we register.
+        """
+        if self._identity.secure_id:
+            return
+        for attribute, getter in (
+            ("_cached_vm_info", get_vm_info),
+            ("_cached_container_info", get_container_info),
+        ):
+            self._reactor.call_in_thread(
+                partial(setattr, self, attribute),
+                None,
+                getter,
+            )
+
+    def _get_vm_info(self):
+        """Return the VM type, caching the first non-empty result."""
+        if not self._cached_vm_info:
+            self._cached_vm_info = get_vm_info()
+        return self._cached_vm_info
+
+    def _get_container_info(self):
+        """Return the container type, caching the first non-empty result."""
+        if not self._cached_container_info:
+            self._cached_container_info = get_container_info()
+        return self._cached_container_info
+
     def _handle_exchange_done(self):
         """Registered handler for the C{"exchange-done"} event.
 
@@ -161,8 +224,13 @@ class RegistrationHandler:
         The first exchange made us accept the message type "register", so
         the next "pre-exchange" event will make L{_handle_pre_exchange}
         queue a registration message for delivery.
+
+        The check is only re-evaluated if the pre-exchange decided not to
+        register, since the exchange itself may have changed the outcome.
         """
-        if self.should_register() and not self._should_register:
+        if self._identity.secure_id:
+            return
+        if not self._should_register and self.should_register():
             self._exchange.exchange()
 
     def _handle_pre_exchange(self):
@@ -171,6 +239,12 @@ class RegistrationHandler:
         set, and we have the needed information available, queue a registration
         message with the server.
         """
+        if self._identity.secure_id:
+            # Already registered, which is the case for every exchange in
+            # the steady state: skip the rest of the checks.
+            self._should_register = False
+            return
+
         # The point of storing this flag is that if we should *not* register
         # now, and then after the exchange we *should*, we schedule an urgent
         # exchange again.  Without this flag we would just spin trying to
@@ -188,15 +262,14 @@ class RegistrationHandler:
             self._reactor.fire("registration-failed", reason="unknown-account")
             return
 
-        tags = identity.tags
+        tags = identity.validated_tags
         group = identity.access_group
         registration_key = identity.registration_key
         hostagent_uid = identity.hostagent_uid
 
         self._message_store.delete_all_messages()
 
-        if not is_valid_tag_list(tags):
-            tags = None
+        if tags is None and identity.tags:
             logging.error("Invalid tags provided for registration.")
 
         message = {
@@ -206,8 +279,8 @@ class RegistrationHandler:
             "computer_title": identity.computer_title,
             "registration_password": identity.registration_key,
             "tags": tags,
-            "container-info": get_container_info(),
-            "vm-info": get_vm_info(),
+            "container-info": self._get_container_info(),
+            "vm-info": self._get_vm_info(),
         }
 
         if self._clone_secure_id:
@@ -236,17 +309,21 @@ class RegistrationHandler:
                 "machine-id": self._juju_data["machine-id"],
             }
 
-        # The computer is a normal computer, possibly a container.
-        with_word = "with" if bool(registration_key) else "without"
-        with_tags = f"and tags {tags} " if tags else ""
-        with_group = f"in access group '{group}' " if group else ""
-
         message["ubuntu_pro_info"] = json.dumps(get_ubuntu_pro_info())
 
-        logging.info(
-            f"Queueing message to register with account {account_name!r} "
-            f"{with_group}{with_tags}{with_word} a password.",
-        )
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            # The computer is a normal computer, possibly a container.
+            with_word = "with" if bool(registration_key) else "without"
+            with_tags = f"and tags {tags} " if tags else ""
+            with_group = f"in access group '{group}' " if group else ""
+            logging.info(
+                "Queueing message to register with account %r %s%s%s a "
+                "password.",
+                account_name,
+                with_group,
+                with_tags,
+                with_word,
+            )
         self._exchange.send(message)
 
     def _handle_set_id(self, message):
@@ -258,17 +335,22 @@ class RegistrationHandler:
         Fire C{"registration-done"} and C{"resynchronize-clients"}.
         """
         cid = self._identity
-        if cid.secure_id:
-            logging.info(f"Overwriting secure_id with '{cid.secure_id}'")
+        # Reading the secure id back is a persist lookup, so only do it for
+        # the log messages that are actually going to be emitted.
+        log_info = logging.getLogger().isEnabledFor(logging.INFO)
+        if log_info and cid.secure_id:
+            logging.info("Overwriting secure_id with '%s'", cid.secure_id)
 
         cid.secure_id = message.get("id")
         cid.insecure_id = message.get("insecure-id")
-        logging.info(
-            "Using new secure-id ending with %s for account %s.",
-            cid.secure_id[-10:],
-            cid.account_name,
-        )
-        logging.debug("Using new secure-id: %s", cid.secure_id)
+        if log_info:
+            logging.info(
+                "Using new secure-id ending with %s for account %s.",
+                cid.secure_id[-10:],
+                cid.account_name,
+            )
+        if logging.getLogger().isEnabledFor(logging.DEBUG):
+            logging.debug("Using new secure-id: %s", cid.secure_id)
         self._reactor.fire("registration-done")
         self._reactor.fire("resynchronize-clients")
 
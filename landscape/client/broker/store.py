@@ -150,6 +150,8 @@ class MessageStore:
         self._max_dirs = max_dirs  # Maximum number of directories in store
         self._max_size_mb = max_size_mb  # Maximum size of message store
         self._schemas = {}
+        self._api_schemas = {}
+        self._accepted_types = None
         self._original_persist = persist
         self._persist = persist.root_at("message-store")
         message_dir = self._message_dir()
@@ -169,6 +171,7 @@ class MessageStore:
         """
         assert type(types) in (tuple, list, set)
         self._persist.set("accepted-types", sorted(set(types)))
+        self._accepted_types = frozenset(types)
         self._reprocess_holding()
 
     def get_accepted_types(self):
@@ -177,7 +180,11 @@ class MessageStore:
 
     def accepts(self, type):
         """Return bool indicating if C{type} is an accepted message type."""
-        return type in self.get_accepted_types()
+        # Keep a set snapshot of the persisted types, which only change
+        # through set_accepted_types, so that checks are a hash lookup.
+        if self._accepted_types is None:
+            self._accepted_types = frozenset(self.get_accepted_types())
+        return type in self._accepted_types
 
     def get_sequence(self):
         """Get the current sequence.
@@ -372,6 +379,25 @@ class MessageStore:
         api = schema.api if schema.api else self._api
         schemas = self._schemas.setdefault(schema.type, {})
         schemas[api] = schema
+        self._api_schemas.clear()
+
+    def _get_schema(self, message_type, server_api):
+        """Return the schema to apply to a message for the given server API.
+
+        This is the schema with the highest API version that is lower or equal
+        to C{server_api}. The choice only depends on the schemas added with
+        L{add_schema}, so it's remembered until a new schema is added.
+        """
+        key = (message_type, server_api)
+        schema = self._api_schemas.get(key)
+        if schema is None:
+            schemas = self._schemas[message_type]
+            for api in sort_versions(schemas.keys()):
+                if is_version_higher(server_api, api):
+                    schema = schemas[api]
+                    break
+            self._api_schemas[key] = schema
+        return schema
 
     def is_pending(self, message_id):
         """Return bool indicating if C{message_id} still hasn't been delivered.
@@ -438,13 +464,7 @@ class MessageStore:
         if "api" not in message:
             message["api"] = server_api
 
-        # We apply the schema with the highest API version that is greater
-        # or equal to the API version the message is tagged with.
-        schemas = self._schemas[message["type"]]
-        for api in sort_versions(schemas.keys()):
-            if is_version_higher(server_api, api):
-                schema = schemas[api]
-                break
+        schema = self._get_schema(message["type"], server_api)
         message = schema.coerce(message)
 
         message_data = bpickle.dumps(message)
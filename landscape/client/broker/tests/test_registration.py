@@ -81,6 +81,32 @@ class IdentityTest(LandscapeTest):
     def test_hostagent_uid(self):
         self.check_config_property("hostagent_uid")
 
+    def test_validated_tags(self):
+        """Valid tags are returned as they are configured."""
+        self.config.tags = "london, server"
+        self.assertEqual("london, server", self.identity.validated_tags)
+
+    def test_validated_tags_with_invalid_tags(self):
+        """Invalid tags are returned as C{None}."""
+        self.config.tags = "<script>alert()</script>"
+        self.assertIs(None, self.identity.validated_tags)
+
+    def test_validated_tags_follows_config(self):
+        """The validated tags are updated when the configured tags change."""
+        self.config.tags = "<script>alert()</script>"
+        self.assertIs(None, self.identity.validated_tags)
+        self.config.tags = "london"
+        self.assertEqual("london", self.identity.validated_tags)
+
+    @mock.patch("landscape.client.broker.registration.is_valid_tag_list")
+    def test_validated_tags_is_cached(self, is_valid_tag_list_mock):
+        """The tags are validated only once for a given configured value."""
+        is_valid_tag_list_mock.return_value = True
+        self.config.tags = "london"
+        self.identity.validated_tags
+        self.identity.validated_tags
+        is_valid_tag_list_mock.assert_called_once_with("london")
+
 
 class RegistrationHandlerTestBase(LandscapeTest):
 
@@ -255,6 +281,100 @@ class RegistrationHandlerTest(RegistrationHandlerTestBase):
         self.assertEqual("lxc", messages[0]["container-info"])
         get_container_info_mock.assert_called_once_with()
 
+    @mock.patch("landscape.client.broker.registration.get_container_info")
+    @mock.patch("landscape.client.broker.registration.get_vm_info")
+    @mock.patch("landscape.client.broker.registration.get_fqdn")
+    def test_queue_message_on_exchange_caches_machine_info(
+        self,
+        get_fqdn_mock,
+        get_vm_info_mock,
+        get_container_info_mock,
+    ):
+        """
+        The VM and container information are looked up only once, and
+        reused for subsequent registration messages. The fqdn may change,
+        so it's looked up again for each message.
+        """
+        get_fqdn_mock.return_value = "machine.example.com"
+        get_vm_info_mock.return_value = b"kvm"
+        get_container_info_mock.return_value = "lxc"
+        self.mstore.set_accepted_types(["register"])
+        self.config.computer_title = "Computer Title"
+        self.config.account_name = "account_name"
+        self.reactor.fire("pre-exchange")
+        self.reactor.fire("pre-exchange")
+        messages = self.mstore.get_pending_messages()
+        self.assertEqual("machine.example.com", messages[0]["hostname"])
+        self.assertEqual(b"kvm", messages[0]["vm-info"])
+        self.assertEqual("lxc", messages[0]["container-info"])
+        self.assertEqual(2, get_fqdn_mock.call_count)
+        get_vm_info_mock.assert_called_once_with()
+        get_container_info_mock.assert_called_once_with()
+
+    @mock.patch("landscape.client.broker.registration.get_vm_info")
+    def test_queue_message_on_exchange_does_not_cache_empty_vm_info(
+        self,
+        get_vm_info_mock,
+    ):
+        """
+        An empty VM type isn't cached, and is looked up again on the
+        next registration message.
+        """
+        get_vm_info_mock.return_value = b""
+        self.mstore.set_accepted_types(["register"])
+        self.config.computer_title = "Computer Title"
+        self.config.account_name = "account_name"
+        self.reactor.fire("pre-exchange")
+        self.reactor.fire("pre-exchange")
+        self.assertEqual(2, get_vm_info_mock.call_count)
+
+    @mock.patch("landscape.client.broker.registration.get_container_info")
+    @mock.patch("landscape.client.broker.registration.get_vm_info")
+    @mock.patch("landscape.client.broker.registration.get_fqdn")
+    def test_machine_info_prefetched_on_run(
+        self,
+        get_fqdn_mock,
+        get_vm_info_mock,
+        get_container_info_mock,
+    ):
+        """
+        The VM and container information are looked up when the reactor
+        starts, and used by the next registration message. The fqdn is
+        only looked up when the message is built.
+        """
+        get_fqdn_mock.return_value = "machine.example.com"
+        get_vm_info_mock.return_value = b"kvm"
+        get_container_info_mock.return_value = "lxc"
+        self.reactor.fire("run")
+        get_fqdn_mock.assert_not_called()
+        get_vm_info_mock.assert_called_once_with()
+        get_container_info_mock.assert_called_once_with()
+
+        self.mstore.set_accepted_types(["register"])
+        self.config.computer_title = "Computer Title"
+        self.config.account_name = "account_name"
+        self.reactor.fire("pre-exchange")
+        messages = self.mstore.get_pending_messages()
+        self.assertEqual("machine.example.com", messages[0]["hostname"])
+        self.assertEqual(b"kvm", messages[0]["vm-info"])
+        self.assertEqual("lxc", messages[0]["container-info"])
+        get_fqdn_mock.assert_called_once_with()
+        get_vm_info_mock.assert_called_once_with()
+        get_container_info_mock.assert_called_once_with()
+
+    @mock.patch("landscape.client.broker.registration.get_vm_info")
+    def test_machine_info_not_prefetched_when_registered(
+        self,
+        get_vm_info_mock,
+    ):
+        """
+        No machine information is looked up at startup if the client is
+        already registered.
+        """
+        self.identity.secure_id = "secure"
+        self.reactor.fire("run")
+        self.assertNot(get_vm_info_mock.called)
+
     def test_queue_message_on_exchange_with_password(self):
         """If a registration password is available, we pass it on!"""
         self.mstore.set_accepted_types(["register"])
@@ -651,6 +771,31 @@ class RegistrationHandlerTest(RegistrationHandlerTestBase):
         self.reactor.fire("exchange-done")
         self.assertNot(self.exchanger.exchange.called)
 
+    def test_exchange_events_skip_checks_when_registered(self):
+        """
+        Once the client has a secure id, the pre-exchange and exchange-done
+        handlers don't check whether to register at all.
+        """
+        self.identity.secure_id = "secure"
+        with mock.patch.object(self.handler, "should_register") as check:
+            self.reactor.fire("pre-exchange")
+            self.reactor.fire("exchange-done")
+        self.assertNot(check.called)
+        self.assertEqual([], self.mstore.get_pending_messages())
+
+    def test_exchange_done_skips_check_when_just_tried(self):
+        """
+        If the pre-exchange already queued a registration message, the
+        exchange-done handler doesn't check again whether to register.
+        """
+        self.mstore.set_accepted_types(["register"])
+        self.config.computer_title = "Computer Title"
+        self.config.account_name = "account_name"
+        self.reactor.fire("pre-exchange")
+        with mock.patch.object(self.handler, "should_register") as check:
+            self.reactor.fire("exchange-done")
+        self.assertNot(check.called)
+
     def test_default_hostname(self):
         self.mstore.set_accepted_types(["register"])
         self.config.computer_title = "Computer Title"
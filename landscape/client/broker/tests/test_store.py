@@ -249,6 +249,28 @@ class MessageStoreTest(LandscapeTest):
         self.store.delete_old_messages()
         self.assertEqual(os.listdir(self.temp_dir), [])
 
+    def test_accepts(self):
+        """
+        L{MessageStore.accepts} tells whether a message type is accepted,
+        following changes to the accepted types.
+        """
+        self.assertTrue(self.store.accepts("data"))
+        self.assertFalse(self.store.accepts("unaccepted"))
+        self.store.set_accepted_types(["unaccepted"])
+        self.assertFalse(self.store.accepts("data"))
+        self.assertTrue(self.store.accepts("unaccepted"))
+
+    def test_accepts_with_persisted_types(self):
+        """
+        L{MessageStore.accepts} honors the accepted types persisted by a
+        previous store.
+        """
+        self.store.commit()
+        persist = Persist(filename=self.persist_filename)
+        store = MessageStore(persist, self.temp_dir)
+        self.assertTrue(store.accepts("data"))
+        self.assertFalse(store.accepts("unaccepted"))
+
     def test_unaccepted(self):
         for i in range(10):
             self.store.add(
@@ -383,9 +405,8 @@ class MessageStoreTest(LandscapeTest):
         self.store.add({"type": "data", "data": 1})
         # We simulate it by creating a fake file which raises halfway through
         # writing a file.
-        mock_open = mock.mock_open()
-        with mock.patch("landscape.lib.fs.open", mock_open):
-            mock_open().write.side_effect = IOError("Sorry, pal!")
+        with mock.patch("landscape.lib.fs.os.write") as mock_write:
+            mock_write.side_effect = IOError("Sorry, pal!")
             # This kind of ensures that raising an exception is somewhat
             # similar to unplugging the power -- i.e., we're not relying
             # on special exception-handling in the file-writing code.
@@ -394,8 +415,7 @@ class MessageStoreTest(LandscapeTest):
                 self.store.add,
                 {"type": "data", "data": 2},
             )
-            mock_open.assert_called_with(mock.ANY, "wb")
-            mock_open().write.assert_called_once_with(mock.ANY)
+            mock_write.assert_called_once_with(mock.ANY, mock.ANY)
         self.assertEqual(
             self.store.get_pending_messages(),
             [{"type": "data", "data": 1, "api": b"3.2"}],
@@ -514,6 +534,26 @@ class MessageStoreTest(LandscapeTest):
             [{"type": "data", "api": b"3.2", "data": b"foo"}],
         )
 
+    def test_message_schema_choice_is_remembered(self):
+        """
+        The schema applied to a message type is only looked up again when
+        a new schema is added.
+        """
+        self.store.add({"type": "data", "data": b"foo"})
+        with mock.patch(
+            "landscape.client.broker.store.sort_versions",
+        ) as sort_versions_mock:
+            self.store.add({"type": "data", "data": b"bar"})
+        sort_versions_mock.assert_not_called()
+
+        self.store.add_schema(Message("data", {"data": Int()}))
+        self.store.add({"type": "data", "data": 123})
+        self.assertRaises(
+            InvalidError,
+            self.store.add,
+            {"type": "data", "data": b"baz"},
+        )
+
     def test_count_pending_messages(self):
         """It is possible to get the total number of pending messages."""
         self.assertEqual(self.store.count_pending_messages(), 0)
@@ -16,16 +16,11 @@ from urllib.parse import urlparse
 from landscape.client import GROUP
 from landscape.client import IS_SNAP
 from landscape.client import USER
-from landscape.client.broker.amp import RemoteBrokerConnector
 from landscape.client.broker.config import BrokerConfiguration
-from landscape.client.broker.registration import Identity
-from landscape.client.broker.registration import RegistrationError
-from landscape.client.broker.service import BrokerService
 from landscape.client.reactor import LandscapeReactor
 from landscape.client.serviceconfig import ServiceConfig
 from landscape.client.serviceconfig import ServiceConfigException
 from landscape.lib import base64
-from landscape.lib.amp import MethodCallError
 from landscape.lib.bootstrap import BootstrapDirectory
 from landscape.lib.bootstrap import BootstrapList
 from landscape.lib.compat import input
@@ -40,6 +35,9 @@ from landscape.lib.twisted_util import gather_results
 
 EXIT_NOT_REGISTERED = 5
 
+# Answers accepted by prompt_yes_no, keyed by their (lower-cased) first letter.
+YES_NO_ANSWERS = {"y": True, "n": False}
+
 
 class ConfigurationError(Exception):
     """Raised when required configuration values are missing."""
@@ -70,15 +68,13 @@ def prompt_yes_no(message, default=True):
     """Prompt for a yes/no question and return the answer as bool."""
     default_msg = "[Y/n]" if default else "[y/N]"
     while True:
-        value = input(f"{message} {default_msg}: ").lower()
-        if value:
-            if value.startswith("n"):
-                return False
-            if value.startswith("y"):
-                return True
-            show_help("Invalid input.")
-        else:
+        value = input(f"{message} {default_msg}: ")
+        if not value:
             return default
+        answer = YES_NO_ANSWERS.get(value[:1].lower())
+        if answer is not None:
+            return answer
+        show_help("Invalid input.")
 
 
 def get_invalid_users(users):
@@ -705,6 +701,9 @@ def handle_registration_errors(add_result, failure, connector):
 
     Note: "results" contains a failure indication already (or will shortly)
     since the registration-failed signal will fire."""
+    from landscape.client.broker.registration import RegistrationError
+    from landscape.lib.amp import MethodCallError
+
     error = failure.trap(RegistrationError, MethodCallError)
     if error is RegistrationError:
         add_result(str(failure.value))
@@ -752,7 +751,7 @@ def got_error(failure, reactor, add_result, print=print):
 def register(
     config,
     reactor=None,
-    connector_factory=RemoteBrokerConnector,
+    connector_factory=None,
     got_connection=got_connection,
     max_retries=14,
     on_error=None,
@@ -767,7 +766,8 @@ def register(
         the client charm does not pass it.
     @param connector_factory: A callable that accepts a reactor and a
         configuration object and returns a new remote broker connection.  Used
-        primarily for dependency injection.
+        primarily for dependency injection, defaults to
+        L{RemoteBrokerConnector}.
     @param got_connection: The handler to trigger when the remote broker
         connects.  Used primarily for dependency injection.
     @param max_retries: The number of times to retry connecting to the
@@ -782,6 +782,11 @@ def register(
     if reactor is None:
         reactor = LandscapeReactor()
 
+    if connector_factory is None:
+        from landscape.client.broker.amp import RemoteBrokerConnector
+
+        connector_factory = RemoteBrokerConnector
+
     if results is None:
         results = []
     add_result = results.append
@@ -855,6 +860,9 @@ def determine_exit_code(what_happened):
 
 def is_registered(config):
     """Return whether the client is already registered."""
+    from landscape.client.broker.registration import Identity
+    from landscape.client.broker.service import BrokerService
+
     persist_filename = os.path.join(
         config.data_path,
         f"{BrokerService.service_name}.bpickle",
@@ -892,6 +900,9 @@ def set_secure_id(config, new_id):
     """Persists a secure id in the identity data file. This is used to indicate
     whether we are currently in the process of registering.
     """
+    from landscape.client.broker.registration import Identity
+    from landscape.client.broker.service import BrokerService
+
     persist = Persist(
         filename=os.path.join(
             config.data_path,
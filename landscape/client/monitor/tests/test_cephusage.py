@@ -3,7 +3,6 @@ from unittest import mock
 from landscape.client.monitor.cephusage import CephUsage
 from landscape.client.tests.helpers import LandscapeTest
 from landscape.client.tests.helpers import MonitorHelper
-from landscape.lib.fs import touch_file
 
 
 class CephUsagePluginTest(LandscapeTest):
@@ -139,8 +138,7 @@ class CephUsagePluginTest(LandscapeTest):
         """
         plugin = CephUsage()
         plugin._has_rados = True
-        plugin._ceph_config = self.makeFile()
-        touch_file(plugin._ceph_config)
+        plugin._ceph_config = self.makeFile("")
         self.assertTrue(plugin._should_run())
 
     def test_wb_handle_usage(self):
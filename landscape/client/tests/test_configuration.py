@@ -2807,7 +2807,7 @@ class SetSecureIdTest(LandscapeTest):
     """Tests for the `set_secure_id` function."""
 
     @mock.patch("landscape.client.configuration.Persist")
-    @mock.patch("landscape.client.configuration.Identity")
+    @mock.patch("landscape.client.broker.registration.Identity")
     def test_function(self, Identity, Persist):
         config = mock.Mock(data_path="/tmp/landscape")
 
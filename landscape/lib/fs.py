@@ -22,8 +22,7 @@ def create_binary_file(path, content):
     @param path: The path to the file.
     @param content: The content to be written in the file.
     """
-    with open(path, "wb") as fd:
-        fd.write(content)
+    _write_binary_file(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, content)
 
 
 def append_text_file(path, content):
@@ -47,8 +46,22 @@ def append_binary_file(path, content):
     @param path: The path to the file.
     @param content: The content to be written in the file at the end.
     """
-    with open(path, "ab") as fd:
-        fd.write(content)
+    _write_binary_file(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, content)
+
+
+def _write_binary_file(path, flags, content):
+    """Write the given binary content to a file opened with C{flags}.
+
+    This uses the file descriptor directly, since going through a buffered
+    file object doesn't buy anything for a single write.
+    """
+    fd = os.open(path, flags, 0o666)
+    try:
+        data = memoryview(content)
+        while data:
+            data = data[os.write(fd, data) :]
+    finally:
+        os.close(fd)
 
 
 def read_text_file(path, limit=None):
@@ -61,21 +74,21 @@ def read_text_file(path, limit=None):
     @return content: The content of the file string, possibly trimmed to
         C{limit} characters.
     """
+    if limit is None or limit >= 0:
+        # Decode while reading, so that we don't hold both the raw bytes and
+        # the decoded text in memory. Disable newline translation to return
+        # the content exactly as it is in the file.
+        with open(path, encoding="utf-8", errors="replace", newline="") as fd:
+            return fd.read(limit)
+
     # Use binary mode since opening a file in text mode in Python 3 does not
-    # allow non-zero offset seek from the end of the file. If a limit is
-    # specified, use the 4*limit as the largest UTF-8 encoding is 4-bytes. We
-    # don't worry about slicing a UTF-8 char in half firstly as error handling
-    # is "replace" below, and secondly because if the first/last char is
-    # corrupted as a result we won't want it anyway (because limit chars must
-    # be before/after the first/last char)
-    content = read_binary_file(path, None if limit is None else limit * 4)
-    content = content.decode("utf-8", "replace")
-    if limit is None:
-        return content
-    elif limit >= 0:
-        return content[:limit]
-    else:
-        return content[limit:]
+    # allow non-zero offset seek from the end of the file. Use 4*limit as the
+    # largest UTF-8 encoding is 4-bytes. We don't worry about slicing a UTF-8
+    # char in half firstly as error handling is "replace" below, and secondly
+    # because if the first char is corrupted as a result we won't want it
+    # anyway (because limit chars must be after the first char)
+    content = read_binary_file(path, limit * 4)
+    return content.decode("utf-8", "replace")[limit:]
 
 
 def read_binary_file(path, limit=None):
@@ -89,11 +102,15 @@ def read_binary_file(path, limit=None):
         C{limit}.
     """
     with open(path, "rb") as fd:
-        if limit is not None and os.path.getsize(path) > abs(limit):
-            if limit >= 0:
-                return fd.read(limit)
-            else:
-                fd.seek(limit, os.SEEK_END)
+        if limit is None:
+            return fd.read()
+        if limit >= 0:
+            return fd.read(limit)
+        try:
+            fd.seek(limit, os.SEEK_END)
+        except OSError:
+            # The file is shorter than the limit, read all of it.
+            pass
         return fd.read()
 
 
@@ -110,7 +127,8 @@ def touch_file(path, offset_seconds=None):
         atime and mtime of the file from the current time.
 
     """
-    open(path, "ab").close()
+    if not os.path.exists(path):
+        os.close(os.open(path, os.O_WRONLY | os.O_CREAT, 0o666))
     if offset_seconds is not None:
         offset_time = long(time.time()) + offset_seconds
         touch_time = (offset_time, offset_time)
@@ -1,7 +1,4 @@
 """A schema system. Yes. Another one!"""
-from twisted.python.compat import iteritems
-from twisted.python.compat import long
-from twisted.python.compat import unicode
 
 
 class InvalidError(Exception):
@@ -52,6 +49,24 @@ class Any:
         )
 
 
+class Nullable:
+    """Something which must be C{None} or match another schema.
+
+    This is equivalent to C{Any(schema, Constant(None))}, but C{None} is
+    accepted without trying, and failing, to coerce it with C{schema}.
+
+    @param schema: The schema that non-C{None} values must match.
+    """
+
+    def __init__(self, schema):
+        self.schema = schema
+
+    def coerce(self, value):
+        if value is None:
+            return None
+        return self.schema.coerce(value)
+
+
 class Bool:
     """Something that must be a C{bool}."""
 
@@ -65,7 +80,7 @@ class Int:
     """Something that must be an C{int} or C{long}."""
 
     def coerce(self, value):
-        if not isinstance(value, (int, long)):
+        if not isinstance(value, int):
             raise InvalidError(f"{value!r} isn't an int or long")
         return value
 
@@ -74,7 +89,7 @@ class Float:
     """Something that must be an C{int}, C{long}, or C{float}."""
 
     def coerce(self, value):
-        if not isinstance(value, (int, long, float)):
+        if not isinstance(value, (int, float)):
             raise InvalidError(f"{value!r} isn't a float")
         return value
 
@@ -115,7 +130,7 @@ class Unicode:
                 raise InvalidError(
                     "{!r} can't be decoded: {}".format(value, str(e)),
                 )
-        if not isinstance(value, unicode):
+        if not isinstance(value, str):
             raise InvalidError(f"{value!r} isn't a unicode")
         return value
 
@@ -180,38 +195,41 @@ class KeyDict:
     def __init__(self, schema, optional=None, strict=True):
         if optional is None:
             optional = []
-        self.optional = set(optional)
+        self.optional = frozenset(optional)
         self.schema = schema
         self._strict = strict
+        # The schema doesn't change after construction, so work out once the
+        # keys that every value must have instead of on each coercion.
+        self._required_keys = frozenset(schema) - self.optional
 
     def coerce(self, value):
         new_dict = {}
         if not isinstance(value, dict):
             raise InvalidError(f"{value!r} is not a dict.")
 
-        for k, v in iteritems(value):
-            unknown_key = k not in self.schema
-
-            if unknown_key and self._strict:
-                raise InvalidError(
-                    f"{k!r} is not a valid key as per {self.schema!r}",
-                )
-            elif unknown_key:
+        schema = self.schema
+        for k, v in value.items():
+            # Look the key up once; schema values are never None.
+            key_schema = schema.get(k)
+
+            if key_schema is None:
+                if self._strict:
+                    raise InvalidError(
+                        f"{k!r} is not a valid key as per {schema!r}",
+                    )
                 # We are in non-strict mode, so we ignore unknown keys.
                 continue
 
             try:
-                new_dict[k] = self.schema[k].coerce(v)
+                new_dict[k] = key_schema.coerce(v)
             except InvalidError as e:
                 raise InvalidError(
                     f"Value of {k!r} key of dict {value!r} could not coerce "
-                    f"with {self.schema[k]}: {e}",
+                    f"with {key_schema}: {e}",
                 )
-        new_keys = set(new_dict.keys())
-        required_keys = set(self.schema.keys()) - self.optional
-        missing = required_keys - new_keys
+        missing = self._required_keys - new_dict.keys()
         if missing:
-            raise InvalidError(f"Missing keys {missing}")
+            raise InvalidError(f"Missing keys {set(missing)}")
         return new_dict
 
 
@@ -9,6 +9,8 @@ from twisted.python.compat import long
 from landscape.lib import testing
 from landscape.lib.fs import append_binary_file
 from landscape.lib.fs import append_text_file
+from landscape.lib.fs import create_binary_file
+from landscape.lib.fs import create_text_file
 from landscape.lib.fs import read_binary_file
 from landscape.lib.fs import read_text_file
 from landscape.lib.fs import touch_file
@@ -58,6 +60,16 @@ class ReadFileTest(BaseTestCase):
             b"foo bar from end",
         )
 
+    @patch("os.path.getsize")
+    def test_read_binary_file_with_limit_does_not_stat(self, getsize_mock):
+        """
+        L{read_binary_file} doesn't need the file size to honor a limit.
+        """
+        path = self.makeFile("foo bar from end")
+        self.assertEqual(read_binary_file(path, limit=3), b"foo")
+        self.assertEqual(read_binary_file(path, limit=-3), b"end")
+        getsize_mock.assert_not_called()
+
     def test_read_text_file(self):
         """
         With no options L{read_text_file} reads the whole file passed as
@@ -106,6 +118,15 @@ class ReadFileTest(BaseTestCase):
         self.assertEqual(read_text_file(path, limit=5), "foo \ufffd")
         self.assertEqual(read_text_file(path, limit=-3), "bar")
 
+    def test_read_text_file_keeps_line_endings(self):
+        """
+        L{read_text_file} returns line endings as they are in the file.
+        """
+        path = self.makeFile(b"foo\r\nbar\r", mode="wb")
+        self.assertEqual(read_text_file(path), "foo\r\nbar\r")
+        self.assertEqual(read_text_file(path, limit=4), "foo\r")
+        self.assertEqual(read_text_file(path, limit=-4), "bar\r")
+
 
 class TouchFileTest(BaseTestCase):
     @patch("os.utime")
@@ -119,6 +140,19 @@ class TouchFileTest(BaseTestCase):
         utime_mock.assert_called_once_with(path, None)
         self.assertFileContent(path, b"")
 
+    def test_touch_existing_file(self):
+        """
+        The L{touch_file} function only updates the modification time of an
+        existing file, without opening it.
+        """
+        path = self.makeFile("foo")
+        os.utime(path, (0, 0))
+        with patch.object(os, "open", wraps=os.open) as open_mock:
+            touch_file(path)
+        open_mock.assert_not_called()
+        self.assertNotEqual(0, os.stat(path).st_mtime)
+        self.assertFileContent(path, b"foo")
+
     def test_touch_file_multiple_times(self):
         """
         The L{touch_file} function can be called multiple times.
@@ -154,6 +188,39 @@ class TouchFileTest(BaseTestCase):
         self.assertFileContent(path, b"")
 
 
+class CreateFileTest(BaseTestCase):
+    def test_create_text_file(self):
+        """
+        The L{create_text_file} function creates a file with the given
+        content encoded with utf-8.
+        """
+        new_file = os.path.join(self.makeDir(), "new_file")
+        create_text_file(new_file, "contents ☃")
+        self.assertFileContent(new_file, b"contents \xe2\x98\x83")
+
+    def test_create_binary_file_replaces_content(self):
+        """
+        The L{create_binary_file} function replaces the content of an existing
+        file.
+        """
+        existing_file = self.makeFile("foo bar baz")
+        create_binary_file(existing_file, b"foo")
+        self.assertFileContent(existing_file, b"foo")
+
+    def test_create_binary_file_with_partial_writes(self):
+        """
+        The L{create_binary_file} function writes all of the content even if
+        the system writes it in several chunks.
+        """
+        new_file = os.path.join(self.makeDir(), "new_file")
+        real_write = os.write
+        with patch.object(os, "write") as write_mock:
+            write_mock.side_effect = lambda fd, data: real_write(fd, data[:2])
+            create_binary_file(new_file, b"foo bar")
+        self.assertEqual(4, write_mock.call_count)
+        self.assertFileContent(new_file, b"foo bar")
+
+
 class AppendFileTest(BaseTestCase):
     def test_append_existing_text_file(self):
         """
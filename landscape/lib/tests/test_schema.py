@@ -12,6 +12,7 @@ from landscape.lib.schema import Int
 from landscape.lib.schema import InvalidError
 from landscape.lib.schema import KeyDict
 from landscape.lib.schema import List
+from landscape.lib.schema import Nullable
 from landscape.lib.schema import Tuple
 from landscape.lib.schema import Unicode
 
@@ -41,6 +42,19 @@ class BasicTypesTest(unittest.TestCase):
     def test_constant_bad(self):
         self.assertRaises(InvalidError, Constant("foo").coerce, object())
 
+    def test_nullable(self):
+        schema = Nullable(Unicode())
+        self.assertEqual(schema.coerce(None), None)
+        self.assertEqual(schema.coerce(b"foo"), "foo")
+
+    def test_nullable_does_not_coerce_none(self):
+        inner = DummySchema()
+        self.assertEqual(Nullable(inner).coerce(None), None)
+        self.assertEqual(Nullable(inner).coerce("foo"), "hello!")
+
+    def test_nullable_bad(self):
+        self.assertRaises(InvalidError, Nullable(Unicode()).coerce, 1)
+
     def test_bool(self):
         self.assertEqual(Bool().coerce(True), True)
         self.assertEqual(Bool().coerce(False), False)
@@ -1,5 +1,6 @@
 import os
 import unittest
+from unittest.mock import patch
 
 from landscape.lib import testing
 from landscape.lib.vm_info import get_container_info
@@ -89,6 +90,20 @@ class GetVMInfoTest(BaseTestCase):
         self.make_dmi_info("bios_vendor", "DigitalOcean")
         self.assertEqual(b"kvm", get_vm_info(root_path=self.root_path))
 
+    def test_get_vm_info_does_not_stat_dmi_files(self):
+        """
+        L{get_vm_info} reads the DMI files directly, without checking first
+        whether they exist.
+        """
+        self.make_dmi_info("bios_vendor", "DigitalOcean")
+        dmi_path = os.path.join(self.root_path, "sys/class/dmi/id")
+        with patch("os.path.exists", wraps=os.path.exists) as exists_mock:
+            self.assertEqual(b"kvm", get_vm_info(root_path=self.root_path))
+        checked_paths = [call.args[0] for call in exists_mock.call_args_list]
+        self.assertFalse(
+            [path for path in checked_paths if path.startswith(dmi_path)],
+        )
+
     def test_get_vm_info_with_bochs_chassis_vendor(self):
         """
         get_vm_info should return "kvm" when chassis_vendor is "Bochs".
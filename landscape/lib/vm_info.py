@@ -9,6 +9,24 @@ from landscape.lib.fs import read_text_file
 
 DMI_FILES = ("sys_vendor", "chassis_vendor", "bios_vendor", "product_name")
 
+# Lower-cased vendor substrings found in DMI files, and the VM type they map
+# to, in matching order.
+DMI_VENDORS = (
+    (b"amazon ec2", b"kvm"),
+    (b"bochs", b"kvm"),
+    (b"digitalocean", b"kvm"),
+    (b"google", b"gce"),
+    (b"innotek", b"virtualbox"),
+    (b"microsoft", b"hyperv"),
+    (b"nutanix", b"kvm"),
+    (b"openstack", b"kvm"),
+    (b"qemu", b"kvm"),
+    (b"kvm", b"kvm"),
+    (b"vmware", b"vmware"),
+    (b"rhev", b"kvm"),
+    (b"parallels", b"kvm"),
+)
+
 
 def get_vm_info(root_path="/"):
     """
@@ -28,9 +46,10 @@ def get_vm_info(root_path="/"):
     dmi_info_path = os.path.join(root_path, "sys/class/dmi/id")
     for dmi_info_file in DMI_FILES:
         dmi_vendor_path = os.path.join(dmi_info_path, dmi_info_file)
-        if not os.path.exists(dmi_vendor_path):
+        try:
+            vendor = _get_vm_by_vendor(dmi_vendor_path)
+        except FileNotFoundError:
             continue
-        vendor = _get_vm_by_vendor(dmi_vendor_path)
         if vendor:
             return vendor
 
@@ -67,22 +86,7 @@ def _get_vm_by_vendor(sys_vendor_path):
     # We need bytes here as required by the message schema.
     vendor = read_binary_file(sys_vendor_path, limit=1024).lower()
 
-    content_vendors_map = (
-        (b"amazon ec2", b"kvm"),
-        (b"bochs", b"kvm"),
-        (b"digitalocean", b"kvm"),
-        (b"google", b"gce"),
-        (b"innotek", b"virtualbox"),
-        (b"microsoft", b"hyperv"),
-        (b"nutanix", b"kvm"),
-        (b"openstack", b"kvm"),
-        (b"qemu", b"kvm"),
-        (b"kvm", b"kvm"),
-        (b"vmware", b"vmware"),
-        (b"rhev", b"kvm"),
-        (b"parallels", b"kvm"),
-    )
-    for name, vm_type in content_vendors_map:
+    for name, vm_type in DMI_VENDORS:
         if name in vendor:
             return vm_type
 
@@ -92,11 +96,12 @@ def _get_vm_by_vendor(sys_vendor_path):
 def _get_vm_legacy(root_path):
     """Check if the host is virtualized looking at /proc/cpuinfo content."""
     try:
-        cpuinfo = read_text_file(os.path.join(root_path, "proc/cpuinfo"))
+        # Search the raw bytes, there's no need to decode the whole file.
+        cpuinfo = read_binary_file(os.path.join(root_path, "proc/cpuinfo"))
     except OSError:
         return b""
 
-    if "qemu" in cpuinfo:
+    if b"qemu" in cpuinfo:
         return b"kvm"
 
     return b""
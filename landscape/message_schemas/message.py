@@ -1,8 +1,8 @@
-from landscape.lib.schema import Any
 from landscape.lib.schema import Bytes
 from landscape.lib.schema import Constant
 from landscape.lib.schema import Float
 from landscape.lib.schema import KeyDict
+from landscape.lib.schema import Nullable
 
 
 class Message(KeyDict):
@@ -24,7 +24,7 @@ class Message(KeyDict):
         self.type = type
         self.api = api
         schema["timestamp"] = Float()
-        schema["api"] = Any(Bytes(), Constant(None))
+        schema["api"] = Nullable(Bytes())
         schema["type"] = Constant(type)
         if optional is not None:
             optional.extend(["timestamp", "api"])
@@ -9,6 +9,7 @@ from landscape.lib.schema import Float
 from landscape.lib.schema import Int
 from landscape.lib.schema import KeyDict
 from landscape.lib.schema import List
+from landscape.lib.schema import Nullable
 from landscape.lib.schema import Tuple
 from landscape.lib.schema import Unicode
 
@@ -262,7 +263,7 @@ SWIFT_USAGE = Message(
 
 KEYSTONE_TOKEN = Message(
     "keystone-token",
-    {"data": Any(Bytes(), Constant(None))},
+    {"data": Nullable(Bytes())},
 )
 
 MEMORY_INFO = Message(
@@ -317,11 +318,11 @@ REGISTER = Message(
     # the message schema field as 'registration_password' in case a new
     # client contacts an older server.
     {
-        "registration_password": Any(Unicode(), Constant(None)),
+        "registration_password": Nullable(Unicode()),
         "computer_title": Unicode(),
         "hostname": Unicode(),
         "account_name": Unicode(),
-        "tags": Any(Unicode(), Constant(None)),
+        "tags": Nullable(Unicode()),
         "vm-info": Bytes(),
         "container-info": Unicode(),
         "access_group": Unicode(),
@@ -343,11 +344,11 @@ REGISTER_3_3 = Message(
     # the message schema field as 'registration_password' in case a new
     # client contacts an older server.
     {
-        "registration_password": Any(Unicode(), Constant(None)),
+        "registration_password": Nullable(Unicode()),
         "computer_title": Unicode(),
         "hostname": Unicode(),
         "account_name": Unicode(),
-        "tags": Any(Unicode(), Constant(None)),
+        "tags": Nullable(Unicode()),
         "vm-info": Bytes(),
         "container-info": Unicode(),
         "juju-info": KeyDict(
@@ -358,7 +359,7 @@ REGISTER_3_3 = Message(
             },
         ),
         "access_group": Unicode(),
-        "clone_secure_id": Any(Unicode(), Constant(None)),
+        "clone_secure_id": Nullable(Unicode()),
         "ubuntu_pro_info": Unicode(),
         "hostagent_uid": Unicode(),
     },
@@ -394,18 +395,18 @@ REGISTER_CLOUD_VM = Message(
     "register-cloud-vm",
     {
         "hostname": Unicode(),
-        "otp": Any(Bytes(), Constant(None)),
+        "otp": Nullable(Bytes()),
         "instance_key": Unicode(),
-        "account_name": Any(Unicode(), Constant(None)),
-        "registration_password": Any(Unicode(), Constant(None)),
+        "account_name": Nullable(Unicode()),
+        "registration_password": Nullable(Unicode()),
         "reservation_key": Unicode(),
         "public_hostname": Unicode(),
         "local_hostname": Unicode(),
-        "kernel_key": Any(Unicode(), Constant(None)),
-        "ramdisk_key": Any(Unicode(), Constant(None)),
+        "kernel_key": Nullable(Unicode()),
+        "ramdisk_key": Nullable(Unicode()),
         "launch_index": Int(),
         "image_key": Unicode(),
-        "tags": Any(Unicode(), Constant(None)),
+        "tags": Nullable(Unicode()),
         "vm-info": Bytes(),
         "public_ipv4": Unicode(),
         "local_ipv4": Unicode(),
@@ -444,12 +445,12 @@ user_data = KeyDict(
     {
         "uid": Int(),
         "username": Unicode(),
-        "name": Any(Unicode(), Constant(None)),
+        "name": Nullable(Unicode()),
         "enabled": Bool(),
-        "location": Any(Unicode(), Constant(None)),
-        "home-phone": Any(Unicode(), Constant(None)),
-        "work-phone": Any(Unicode(), Constant(None)),
-        "primary-gid": Any(Int(), Constant(None)),
+        "location": Nullable(Unicode()),
+        "home-phone": Nullable(Unicode()),
+        "work-phone": Nullable(Unicode()),
+        "primary-gid": Nullable(Int()),
         "primary-groupname": Unicode(),
     },
     optional=["primary-groupname", "primary-gid"],
@@ -513,35 +514,10 @@ USERS_2_1 = Message(
     ],
 )
 
-USERS_2_0 = Message(
-    "users",
-    {
-        "operation-id": Int(),
-        "create-users": List(user_data),
-        "update-users": List(user_data),
-        "delete-users": List(Int()),
-        "create-groups": List(group_data),
-        "update-groups": List(group_data),
-        "delete-groups": List(Int()),
-        "create-group-members": Dict(Int(), List(Int())),
-        "delete-group-members": Dict(Int(), List(Int())),
-    },
-    # operation-id is only there for responses, and all other are
-    # optional as long as one of them is there (no way to say that yet)
-    optional=[
-        "operation-id",
-        "create-users",
-        "update-users",
-        "delete-users",
-        "create-groups",
-        "update-groups",
-        "delete-groups",
-        "create-group-members",
-        "delete-group-members",
-    ],
-)
+# The users message format didn't change between API 2.0 and 2.1.
+USERS_2_0 = USERS_2_1
 
-opt_str = Any(Unicode(), Constant(None))
+opt_str = Nullable(Unicode())
 OLD_USERS = Message(
     "users",
     {
@@ -568,7 +544,10 @@ OLD_USERS = Message(
     optional=["groups"],
 )
 
-package_ids_or_ranges = List(Any(Tuple(Int(), Int()), Int()))
+# Ranges are only used for runs of three or more ids (see sequence_to_ranges),
+# so most items are single ids: check for those first, as every mismatch in
+# Any costs an InvalidError.
+package_ids_or_ranges = List(Any(Int(), Tuple(Int(), Int())))
 PACKAGES = Message(
     "packages",
     {
@@ -618,8 +597,8 @@ CHANGE_PACKAGES_RESULT = Message(
     "change-packages-result",
     {
         "operation-id": Int(),
-        "must-install": List(Any(Int(), Constant(None))),
-        "must-remove": List(Any(Int(), Constant(None))),
+        "must-install": List(Nullable(Int())),
+        "must-remove": List(Nullable(Int())),
         "result-code": Int(),
         "result-text": Unicode(),
     },
@@ -651,8 +630,8 @@ ADD_PACKAGES = Message(
                     "section": Unicode(),
                     "relations": List(Tuple(Int(), Unicode())),
                     "summary": Unicode(),
-                    "installed-size": Any(Int(), Constant(None)),
-                    "size": Any(Int(), Constant(None)),
+                    "installed-size": Nullable(Int()),
+                    "size": Nullable(Int()),
                     "version": Unicode(),
                     "type": Int(),
                 },
@@ -698,13 +677,13 @@ REBOOT_REQUIRED_INFO = Message(
 
 APT_PREFERENCES = Message(
     "apt-preferences",
-    {"data": Any(Dict(Unicode(), Unicode()), Constant(None))},
+    {"data": Nullable(Dict(Unicode(), Unicode()))},
 )
 
 EUCALYPTUS_INFO = Message(
     "eucalyptus-info",
     {
-        "basic_info": Dict(Bytes(), Any(Bytes(), Constant(None))),
+        "basic_info": Dict(Bytes(), Nullable(Bytes())),
         "walrus_info": Bytes(),
         "cluster_controller_info": Bytes(),
         "storage_controller_info": Bytes(),
@@ -756,7 +735,7 @@ UPDATE_MANAGER_INFO = Message("update-manager-info", {"prompt": Unicode()})
 
 COMPUTER_TAGS = Message(
     "computer-tags",
-    {"tags": Any(Unicode(), Constant(None))},
+    {"tags": Nullable(Unicode())},
 )
 
 UBUNTU_PRO_INFO = Message("ubuntu-pro-info", {"ubuntu-pro-info": Unicode()})